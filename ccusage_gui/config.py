@@ -74,8 +74,8 @@ class AppConfig:
             self.window_state = {
                 "width": 1200,
                 "height": 800,
-                "x": -1,
-                "y": -1,
+                "x": None,  # None until a position has been saved
+                "y": None,
                 "maximized": False
             }
 
@@ -271,7 +271,8 @@ class ConfigManager:
 
         return existing_paths
 
-    def update_window_state(self, width: int, height: int, x: int, y: int, maximized: bool = False):
+    def update_window_state(self, width: int, height: int, x: Optional[int], y: Optional[int],
+                            maximized: bool = False):
         """Update window state in configuration."""
         self.config.window_state.update({
             "width": width,
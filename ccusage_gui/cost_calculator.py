@@ -298,15 +298,45 @@ class CostCalculator:
         Returns:
             CostCalculation object or None if calculation fails
         """
-        pricing = self.get_model_pricing(record.model)
+        return self.calculate_cost_from_totals(
+            record.model,
+            record.input_tokens,
+            record.output_tokens,
+            record.cache_creation_tokens,
+            record.cache_read_tokens
+        )
+
+    def calculate_cost_from_totals(self,
+                                   model: str,
+                                   input_tokens: int,
+                                   output_tokens: int,
+                                   cache_creation_tokens: int,
+                                   cache_read_tokens: int) -> Optional[CostCalculation]:
+        """
+        Calculate cost for token counts of a single model.
+
+        Cost is linear in the token counts, so this can price the summed
+        usage of many records of one model in a single call.
+
+        Args:
+            model: Model name used for pricing
+            input_tokens: Number of input tokens
+            output_tokens: Number of output tokens
+            cache_creation_tokens: Number of cache creation tokens
+            cache_read_tokens: Number of cache read tokens
+
+        Returns:
+            CostCalculation object or None if calculation fails
+        """
+        pricing = self.get_model_pricing(model)
         if not pricing:
             return None
 
         # Calculate costs for each token type
-        input_cost = (record.input_tokens / 1000) * pricing.input_price_per_1k
-        output_cost = (record.output_tokens / 1000) * pricing.output_price_per_1k
-        cache_creation_cost = (record.cache_creation_tokens / 1000) * pricing.cache_creation_price_per_1k
-        cache_read_cost = (record.cache_read_tokens / 1000) * pricing.cache_read_price_per_1k
+        input_cost = (input_tokens / 1000) * pricing.input_price_per_1k
+        output_cost = (output_tokens / 1000) * pricing.output_price_per_1k
+        cache_creation_cost = (cache_creation_tokens / 1000) * pricing.cache_creation_price_per_1k
+        cache_read_cost = (cache_read_tokens / 1000) * pricing.cache_read_price_per_1k
 
         total_cost = input_cost + output_cost + cache_creation_cost + cache_read_cost
 
@@ -317,7 +347,7 @@ class CostCalculator:
             cache_read_cost=cache_read_cost,
             total_cost=total_cost,
             currency=pricing.currency,
-            model=record.model
+            model=model
         )
 
     def calculate_total_cost(self, records: List[UsageRecord]) -> Dict[str, float]:
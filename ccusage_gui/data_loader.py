@@ -6,12 +6,15 @@ Handles reading and parsing Claude Code JSONL files from local directories.
 
 import json
 import os
+import sys
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Iterator, NamedTuple
 from datetime import datetime
 import glob
 
+from .utils import find_files, map_concurrent
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,14 +59,36 @@ class DataLoader:
         """
         self.data_paths = [Path(p) for p in data_paths if os.path.exists(p)]
         self._usage_cache: Optional[List[UsageRecord]] = None
+        self._data_signature: Optional[tuple] = None
 
-    def discover_data_files(self) -> List[Path]:
+    def discover_data_files(self, jsonl_files: Optional[List[Path]] = None) -> List[Path]:
         """
         Discover all JSONL files in configured data directories.
 
+        Args:
+            jsonl_files: JSONL files already found by _find_jsonl_files, to
+                avoid walking the data directories again
+
         Returns:
             List of JSONL file paths containing Claude usage data
         """
+        if jsonl_files is None:
+            jsonl_files = self._find_jsonl_files()
+
+        # Filter for files that look like Claude usage data, checking files concurrently
+        is_usage = map_concurrent(self._is_claude_usage_file, jsonl_files)
+        files = [path for path, keep in zip(jsonl_files, is_usage) if keep]
+
+        logger.info(f"Discovered {len(files)} Claude usage files total")
+        return files
+
+    def _find_jsonl_files(self) -> List[Path]:
+        """
+        Find all JSONL files in configured data directories.
+
+        Returns:
+            List of JSONL file paths
+        """
         files = []
 
         for data_path in self.data_paths:
@@ -73,19 +98,14 @@ class DataLoader:
 
             try:
                 # Look for .jsonl files recursively
-                jsonl_files = list(data_path.rglob("*.jsonl"))
-
-                # Filter for files that look like Claude usage data
-                for file_path in jsonl_files:
-                    if self._is_claude_usage_file(file_path):
-                        files.append(file_path)
+                jsonl_files = find_files(data_path, "*.jsonl")
+                files.extend(jsonl_files)
 
                 logger.info(f"Found {len(jsonl_files)} JSONL files in {data_path}")
 
             except Exception as e:
                 logger.error(f"Error scanning directory {data_path}: {e}")
 
-        logger.info(f"Discovered {len(files)} Claude usage files total")
         return files
 
     def _is_claude_usage_file(self, file_path: Path) -> bool:
@@ -166,8 +186,12 @@ class DataLoader:
 
         logger.info("Loading Claude usage data...")
 
+        # Taken before reading so writes during the load show up as a change
+        jsonl_files = self._find_jsonl_files()
+        signature = self._build_signature(jsonl_files)
+
         all_records = []
-        data_files = self.discover_data_files()
+        data_files = self.discover_data_files(jsonl_files)
 
         for file_path in data_files:
             try:
@@ -182,10 +206,57 @@ class DataLoader:
         all_records.sort(key=lambda r: r.timestamp)
 
         self._usage_cache = all_records
+        self._data_signature = signature
         logger.info(f"Loaded {len(all_records)} total usage records")
 
         return all_records
 
+    def get_data_signature(self) -> tuple:
+        """
+        Build a cheap fingerprint of the JSONL files in the data directories.
+
+        Only file metadata is read, so this is much cheaper than a reload.
+
+        Returns:
+            Sorted tuple of (path, modification time, size) for every JSONL file
+        """
+        return self._build_signature(self._find_jsonl_files())
+
+    @staticmethod
+    def _build_signature(jsonl_files: List[Path]) -> tuple:
+        """
+        Build the data signature from already discovered JSONL files.
+
+        Args:
+            jsonl_files: JSONL file paths to fingerprint
+
+        Returns:
+            Sorted tuple of (path, modification time, size) for every file
+        """
+        signature = []
+
+        for file_path in jsonl_files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            signature.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+
+        signature.sort()
+        return tuple(signature)
+
+    def data_changed(self) -> bool:
+        """
+        Check whether the data files changed since the cached load.
+
+        Returns:
+            True if there is no cached data or any JSONL file was added,
+            removed or modified
+        """
+        if self._usage_cache is None:
+            return True
+        return self.get_data_signature() != self._data_signature
+
     def _parse_jsonl_file(self, file_path: Path) -> List[UsageRecord]:
         """
         Parse a single JSONL file and extract usage records.
@@ -298,7 +369,9 @@ class DataLoader:
 
         for field in model_fields:
             if field in data and data[field]:
-                return str(data[field])
+                # Interned so the many records sharing a model share one string,
+                # making model-keyed dict lookups hit the identity fast path
+                return sys.intern(str(data[field]))
 
         return None
 
@@ -400,8 +473,7 @@ class DataLoader:
             List of unique model names
         """
         records = self.load_usage_data()
-        models = set(record.model for record in records)
-        return sorted(models)
+        return sorted({record.model for record in records})
 
     def get_date_range(self) -> tuple[Optional[datetime], Optional[datetime]]:
         """
@@ -415,8 +487,8 @@ class DataLoader:
         if not records:
             return None, None
 
-        timestamps = [record.timestamp for record in records]
-        return min(timestamps), max(timestamps)
+        # load_usage_data returns records sorted by timestamp
+        return records[0].timestamp, records[-1].timestamp
 
     def filter_records(self,
                       start_date: Optional[datetime] = None,
@@ -454,4 +526,5 @@ class DataLoader:
 
     def clear_cache(self):
         """Clear the cached usage data to force reload."""
-        self._usage_cache = None
\ No newline at end of file
+        self._usage_cache = None
+        self._data_signature = None
\ No newline at end of file
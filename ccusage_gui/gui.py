@@ -6,22 +6,31 @@ Main application window and GUI components.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import webbrowser
 import threading
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 import json
 import logging
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
 
 from .config import ConfigManager
 from .data_loader import DataLoader
 from .cost_calculator import CostCalculator
 from .reports import ReportGenerator
-from .utils import format_currency, format_number, setup_logging
+from .utils import format_currency, format_number
 
 logger = logging.getLogger(__name__)
 
+# Table cells repeat many values (zeros, small counts); memoize their formatting.
+# typed=True keeps 1 and 1.0 apart, since they format differently.
+_format_number = lru_cache(maxsize=8192, typed=True)(format_number)
+_format_currency = lru_cache(maxsize=8192, typed=True)(format_currency)
+
 
 class MainApplication:
     """
@@ -35,6 +44,21 @@ class MainApplication:
     - Configuration management
     """
 
+    # Shared ttk style, configured once per process
+    _style: Optional[ttk.Style] = None
+
+    # Number of generated reports kept for quick filter/report-type switching
+    REPORT_CACHE_SIZE = 16
+
+    # Rows inserted into the report table per idle callback
+    TABLE_BATCH_SIZE = 200
+
+    # Formatted table rows kept across refreshes of the report table
+    ROW_CACHE_SIZE = 20000
+
+    # Characters of documentation inserted per idle callback
+    DOC_CHUNK_SIZE = 65536
+
     def __init__(self, root: tk.Tk, config_manager: ConfigManager):
         """
         Initialize the main application.
@@ -49,11 +73,31 @@ class MainApplication:
         self.cost_calculator: Optional[CostCalculator] = None
         self.report_generator: Optional[ReportGenerator] = None
 
-        # Setup logging
-        setup_logging("INFO")
+        # Report regeneration tracking
+        self._data_version = 0
+        self._last_gen_key: Optional[tuple] = None
+        self._pending_gen_key: Optional[tuple] = None
+        self._report_token = 0
+        self._report_cache: OrderedDict[tuple, list] = OrderedDict()
+
+        # Formatted rows by report entry identity: id(entry) -> (entry, row)
+        self._row_cache: Dict[int, tuple] = {}
+
+        # Report currently shown in the table (used by export)
+        self._current_report: list = []
+        self._current_report_type = "daily"
+
+        # Record list the summary tab currently describes
+        self._summary_records: Optional[list] = None
 
-        # Initialize components
-        self._setup_data_components()
+        # Pending idle callback that is still filling the report table
+        self._table_fill_job: Optional[str] = None
+
+        # Documentation window is built on first open and reused afterwards
+        self._doc_window: Optional[tk.Toplevel] = None
+        self._doc_text_cache: Optional[str] = None
+
+        # Build the window first; data components are created on the loader thread
         self._setup_gui()
         self._load_initial_data()
 
@@ -79,14 +123,32 @@ class MainApplication:
 
         except Exception as e:
             logger.error(f"Error initializing data components: {e}")
-            messagebox.showerror("Initialization Error",
-                               f"Failed to initialize data components:\n{e}")
+            self.root.after(0, self._on_init_error, str(e))
+
+    @classmethod
+    def init_style(cls) -> ttk.Style:
+        """
+        Select the ttk theme once and return the shared style.
+
+        Safe to call repeatedly; only the first call touches the theme.
+        """
+        if cls._style is not None:
+            return cls._style
+
+        style = ttk.Style()
+        available = set(style.theme_names())
+        for theme in ('winnative', 'vista', 'clam', 'default'):
+            if theme in available:
+                style.theme_use(theme)  # Prefer the Windows native theme
+                break
+
+        cls._style = style
+        return style
 
     def _setup_gui(self):
         """Setup the main GUI interface."""
-        # Configure style
-        style = ttk.Style()
-        style.theme_use('winnative')  # Windows native theme
+        # Configure style (shared across instances, applied once per process)
+        self.init_style()
 
         # Main container
         self.main_frame = ttk.Frame(self.root, padding="10")
@@ -153,31 +215,46 @@ class MainApplication:
         toolbar_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
 
         # Report type selection
-        ttk.Label(toolbar_frame, text="Report Type:").grid(row=0, column=0, padx=(0, 5))
-
         self.report_type_var = tk.StringVar(value="daily")
-        report_combo = ttk.Combobox(toolbar_frame, textvariable=self.report_type_var,
-                                  values=["daily", "monthly", "weekly", "session", "blocks"],
-                                  state="readonly", width=10)
-        report_combo.grid(row=0, column=1, padx=(0, 20))
+        report_combo = self._add_labeled_field(
+            toolbar_frame, 0, "Report Type:", ttk.Combobox, padx=(0, 20),
+            textvariable=self.report_type_var,
+            values=["daily", "monthly", "weekly", "session", "blocks"],
+            state="readonly", width=10)
         report_combo.bind('<<ComboboxSelected>>', self._on_report_type_changed)
 
-        # Date range filters
-        ttk.Label(toolbar_frame, text="From:").grid(row=0, column=2, padx=(0, 5))
-        self.start_date_var = tk.StringVar()
-        start_date_entry = ttk.Entry(toolbar_frame, textvariable=self.start_date_var, width=12)
-        start_date_entry.grid(row=0, column=3, padx=(0, 10))
-
-        ttk.Label(toolbar_frame, text="To:").grid(row=0, column=4, padx=(0, 5))
-        self.end_date_var = tk.StringVar()
-        end_date_entry = ttk.Entry(toolbar_frame, textvariable=self.end_date_var, width=12)
-        end_date_entry.grid(row=0, column=5, padx=(0, 20))
+        # Date range filters (read directly when filters are applied)
+        self.start_date_entry = self._add_labeled_field(
+            toolbar_frame, 2, "From:", ttk.Entry, padx=(0, 10), width=12)
+        self.end_date_entry = self._add_labeled_field(
+            toolbar_frame, 4, "To:", ttk.Entry, padx=(0, 20), width=12)
 
         # Filter and refresh buttons
         ttk.Button(toolbar_frame, text="Apply Filters", command=self._apply_filters).grid(row=0, column=6, padx=(0, 10))
         ttk.Button(toolbar_frame, text="Clear Filters", command=self._clear_filters).grid(row=0, column=7, padx=(0, 10))
         ttk.Button(toolbar_frame, text="Refresh", command=self._refresh_data).grid(row=0, column=8)
 
+    def _add_labeled_field(self, parent, column: int, label: str, widget_cls,
+                           padx=(0, 10), **widget_kwargs):
+        """
+        Add a caption and input widget pair to a toolbar row.
+
+        Args:
+            parent: Container frame
+            column: Grid column for the caption; the widget goes in the next one
+            label: Caption text
+            widget_cls: Input widget class (e.g. ttk.Entry, ttk.Combobox)
+            padx: Horizontal padding after the input widget
+            **widget_kwargs: Options passed to the input widget
+
+        Returns:
+            The created input widget
+        """
+        ttk.Label(parent, text=label).grid(row=0, column=column, padx=(0, 5))
+        widget = widget_cls(parent, **widget_kwargs)
+        widget.grid(row=0, column=column + 1, padx=padx)
+        return widget
+
     def _setup_content_area(self):
         """Setup the main content area."""
         # Create notebook for different views
@@ -247,6 +324,10 @@ class MainApplication:
         # Summary labels
         self.summary_labels = {}
 
+        # Named font resolved once by Tk and shared by every caption
+        self._summary_caption_font = tkfont.Font(
+            self.root, family='TkDefaultFont', size=9, weight='bold')
+
         row = 0
         for label, key in [
             ("Total Records:", "total_records"),
@@ -256,7 +337,7 @@ class MainApplication:
             ("Average Cost per Day:", "avg_daily_cost"),
             ("Most Used Model:", "top_model")
         ]:
-            ttk.Label(self.summary_frame, text=label, font=('TkDefaultFont', 9, 'bold')).grid(
+            ttk.Label(self.summary_frame, text=label, font=self._summary_caption_font).grid(
                 row=row, column=0, sticky=tk.W, padx=10, pady=5)
 
             value_label = ttk.Label(self.summary_frame, text="Loading...")
@@ -271,15 +352,28 @@ class MainApplication:
         status_bar = ttk.Label(self.main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
         status_bar.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
 
-    def _load_initial_data(self):
-        """Load initial data in background thread."""
+    def _load_initial_data(self, refresh: bool = False):
+        """
+        Load initial data in background thread.
+
+        Args:
+            refresh: Reload from disk, unless the data files are unchanged
+        """
         def load_data():
             try:
-                self.status_var.set("Loading Claude Code usage data...")
-                self.root.update()
+                # Tk is not thread-safe; schedule UI updates on the main thread
+                self.root.after(0, self.status_var.set, "Loading Claude Code usage data...")
+
+                # Pricing and loader setup can touch disk/network; keep it off the UI thread
+                if self.data_loader is None:
+                    self._setup_data_components()
 
                 if self.data_loader:
-                    records = self.data_loader.load_usage_data()
+                    if refresh and not self.data_loader.data_changed():
+                        self.root.after(0, self.status_var.set, "Usage data is up to date")
+                        return
+
+                    records = self.data_loader.load_usage_data(force_reload=refresh)
                     logger.info(f"Loaded {len(records)} usage records")
 
                     # Update UI in main thread
@@ -295,62 +389,149 @@ class MainApplication:
 
     def _on_data_loaded(self, records):
         """Handle successful data loading."""
+        self._data_version += 1
+        # Reports and rows built from the previous data can no longer be shown
+        self._report_cache.clear()
+        self._row_cache.clear()
         self.status_var.set(f"Loaded {len(records)} usage records")
         self._update_summary(records)
-        self._generate_current_report()
+        self._generate_current_report(records)
+
+    def _on_init_error(self, error_message):
+        """Handle data component initialization error."""
+        self.status_var.set("Initialization failed")
+        messagebox.showerror("Initialization Error",
+                           f"Failed to initialize data components:\n{error_message}")
 
     def _on_data_load_error(self, error_message):
         """Handle data loading error."""
         self.status_var.set("Error loading data")
         messagebox.showerror("Data Load Error", f"Failed to load usage data:\n{error_message}")
 
-    def _generate_current_report(self):
-        """Generate report based on current settings."""
+    def _generate_current_report(self, records: Optional[list] = None):
+        """
+        Generate report based on current settings.
+
+        The report is built on a worker thread; the table is updated from
+        the UI thread once the result is ready.
+
+        Args:
+            records: Usage records to report on; loaded from the data loader if None
+        """
         if not self.report_generator or not self.data_loader:
             return
 
-        try:
-            self.status_var.set("Generating report...")
-            self.root.update()
-
-            # Get all records
-            records = self.data_loader.load_usage_data()
-
-            # Apply date filters
-            start_date = self._parse_date(self.start_date_var.get())
-            end_date = self._parse_date(self.end_date_var.get())
-
-            # Generate report based on type
-            report_type = self.report_type_var.get()
-
-            if report_type == "daily":
-                report_data = self.report_generator.generate_daily_report(records, start_date, end_date)
-            elif report_type == "monthly":
-                report_data = self.report_generator.generate_monthly_report(records, start_date, end_date)
-            elif report_type == "weekly":
-                report_data = self.report_generator.generate_weekly_report(records, start_date, end_date)
-            elif report_type == "session":
-                report_data = self.report_generator.generate_session_report(records, start_date, end_date)
-            elif report_type == "blocks":
-                report_data = self.report_generator.generate_blocks_report(records, start_date, end_date)
-            else:
-                report_data = []
+        # Skip regeneration when neither the filters nor the data changed
+        report_type = self.report_type_var.get()
+        start_str = self.start_date_entry.get()
+        end_str = self.end_date_entry.get()
+        key = (report_type, start_str, end_str, self._data_version)
+        if key == self._pending_gen_key:
+            return
+        if key == self._last_gen_key:
+            # The table already shows this report; drop any other report still being built
+            if self._pending_gen_key is not None:
+                self._pending_gen_key = None
+                self._report_token += 1
+                self.status_var.set(f"Generated {self._current_report_type} report "
+                                    f"with {len(self._current_report)} entries")
+            return
 
-            # Update table
-            self._update_report_table(report_data, report_type)
+        # Apply date filters
+        start_date = self._parse_date(start_str)
+        end_date = self._parse_date(end_str)
+
+        # Reuse a cached report when possible
+        cache_key = (report_type, start_date, end_date, self._data_version)
+        report_data = self._report_cache.get(cache_key)
+        if report_data is not None:
+            self._report_cache.move_to_end(cache_key)
+            self._pending_gen_key = None
+            self._report_token += 1  # Discard any report still being generated
+            self._show_report(report_data, report_type, key)
+            return
 
-            self.status_var.set(f"Generated {report_type} report with {len(report_data)} entries")
+        self._report_token += 1
+        token = self._report_token
+        self._pending_gen_key = key
+        self.status_var.set("Generating report...")
 
-        except Exception as e:
-            logger.error(f"Error generating report: {e}")
-            self.status_var.set("Error generating report")
-            messagebox.showerror("Report Error", f"Failed to generate report:\n{e}")
+        def build_report():
+            try:
+                # Get all records unless the caller already has them
+                report_records = records
+                if report_records is None:
+                    report_records = self.data_loader.load_usage_data()
+
+                report_data = self._build_report(report_records, report_type, start_date, end_date)
+                self.root.after(0, self._on_report_generated,
+                                token, key, cache_key, report_data, report_type)
+
+            except Exception as e:
+                logger.error(f"Error generating report: {e}")
+                self.root.after(0, self._on_report_error, token, str(e))
+
+        thread = threading.Thread(target=build_report, daemon=True)
+        thread.start()
+
+    def _on_report_generated(self, token: int, key: tuple, cache_key: tuple,
+                             report_data: list, report_type: str):
+        """Handle a report finished on the worker thread."""
+        if token != self._report_token:
+            return  # A newer request superseded this one
+
+        self._pending_gen_key = None
+        self._report_cache[cache_key] = report_data
+        if len(self._report_cache) > self.REPORT_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+
+        self._show_report(report_data, report_type, key)
+
+    def _on_report_error(self, token: int, error_message: str):
+        """Handle a report generation error from the worker thread."""
+        if token != self._report_token:
+            return
+
+        self._pending_gen_key = None
+        self.status_var.set("Error generating report")
+        messagebox.showerror("Report Error", f"Failed to generate report:\n{error_message}")
+
+    def _show_report(self, report_data: list, report_type: str, key: tuple):
+        """Display a generated report in the table."""
+        self._update_report_table(report_data, report_type)
+        self._last_gen_key = key
+        self._current_report = report_data
+        self._current_report_type = report_type
+
+        self.status_var.set(f"Generated {report_type} report with {len(report_data)} entries")
+
+    def _build_report(self, records, report_type: str,
+                      start_date: Optional[datetime],
+                      end_date: Optional[datetime]) -> list:
+        """Run the report generator for the given report type."""
+        if report_type == "daily":
+            return self.report_generator.generate_daily_report(records, start_date, end_date)
+        elif report_type == "monthly":
+            return self.report_generator.generate_monthly_report(records, start_date, end_date)
+        elif report_type == "weekly":
+            return self.report_generator.generate_weekly_report(records, start_date, end_date)
+        elif report_type == "session":
+            return self.report_generator.generate_session_report(records, start_date, end_date)
+        elif report_type == "blocks":
+            return self.report_generator.generate_blocks_report(records, start_date, end_date)
+        return []
 
     def _update_report_table(self, report_data, report_type):
         """Update the report table with new data."""
-        # Clear existing data
-        for item in self.report_tree.get_children():
-            self.report_tree.delete(item)
+        # Stop filling rows from a previous report
+        if self._table_fill_job is not None:
+            self.root.after_cancel(self._table_fill_job)
+            self._table_fill_job = None
+
+        # Clear existing data in a single Tcl call
+        children = self.report_tree.get_children('')
+        if children:
+            self.report_tree.delete(*children)
 
         # Update column headers based on report type
         if report_type == "session":
@@ -363,43 +544,119 @@ class MainApplication:
             self.report_tree.heading('date', text='Date')
             self.report_tree.heading('tokens', text='Total Tokens')
 
-        # Add new data
-        for entry in report_data:
-            if report_type == "session":
-                values = (
-                    entry.session_id[:16] + "..." if len(entry.session_id) > 16 else entry.session_id,
-                    f"{entry.duration_minutes:.1f}",
-                    format_number(entry.input_tokens),
-                    format_number(entry.output_tokens),
-                    format_number(entry.cache_creation_tokens),
-                    format_number(entry.cache_read_tokens),
-                    format_currency(entry.total_cost)
-                )
-            elif report_type == "blocks":
-                values = (
-                    entry.block_start.strftime('%m/%d %H:%M'),
-                    str(entry.sessions_count),
-                    format_number(entry.input_tokens),
-                    format_number(entry.output_tokens),
-                    format_number(entry.cache_creation_tokens),
-                    format_number(entry.cache_read_tokens),
-                    format_currency(entry.total_cost)
-                )
+        # Freeze column auto-stretch while rows are inserted
+        for column in self.report_tree['columns']:
+            self.report_tree.column(column, stretch=False)
+
+        # Add new data: the first batch now, the rest while the UI is idle
+        rows = self._get_report_rows(report_data, report_type)
+        self._fill_report_table(iter(rows))
+
+    def _get_report_rows(self, report_data, report_type: str) -> List[tuple]:
+        """
+        Return table rows for the report, formatting only entries not seen before.
+
+        Cached reports hand back the same entry objects, so switching filters or
+        report types reuses rows that were already formatted.
+
+        Args:
+            report_data: Report entries of a single type
+            report_type: Report type the entries belong to
+
+        Returns:
+            List of row tuples matching the table columns
+        """
+        cache = self._row_cache
+        rows: List[Optional[tuple]] = [None] * len(report_data)
+        missing = []
+
+        for index, entry in enumerate(report_data):
+            cached = cache.get(id(entry))
+            # The stored entry keeps its id alive; the identity check guards reuse
+            if cached is not None and cached[0] is entry:
+                rows[index] = cached[1]
             else:
-                values = (
-                    entry.date.strftime('%Y-%m-%d'),
-                    format_number(entry.total_tokens),
-                    format_number(entry.input_tokens),
-                    format_number(entry.output_tokens),
-                    format_number(entry.cache_creation_tokens),
-                    format_number(entry.cache_read_tokens),
-                    format_currency(entry.total_cost)
-                )
-
-            self.report_tree.insert('', 'end', values=values)
+                missing.append(index)
+
+        if missing:
+            fresh = self._format_report_rows([report_data[i] for i in missing], report_type)
+            for index, row in zip(missing, fresh):
+                entry = report_data[index]
+                rows[index] = row
+                cache[id(entry)] = (entry, row)
+
+            # Evict the oldest rows first (dicts keep insertion order)
+            excess = len(cache) - self.ROW_CACHE_SIZE
+            if excess > 0:
+                for key in list(islice(cache, excess)):
+                    del cache[key]
+
+        return rows
+
+    def _fill_report_table(self, rows: Iterator[tuple], start: int = 0):
+        """
+        Insert the next batch of table rows and schedule the remainder.
+
+        Args:
+            rows: Iterator over formatted row tuples not yet inserted
+            start: Index of the next row, used as its item id
+        """
+        # Explicit row-index iids spare Tk from generating item ids
+        insert = self.report_tree.insert
+        index = start
+        for values in islice(rows, self.TABLE_BATCH_SIZE):
+            insert('', 'end', iid=str(index), values=values)
+            index += 1
+
+        if index - start == self.TABLE_BATCH_SIZE:
+            self._table_fill_job = self.root.after_idle(self._fill_report_table, rows, index)
+            return
+
+        # All rows inserted; let the columns follow the window size again
+        self._table_fill_job = None
+        for column in self.report_tree['columns']:
+            self.report_tree.column(column, stretch=True)
+
+    @staticmethod
+    def _format_report_rows(report_data, report_type: str) -> List[tuple]:
+        """
+        Format report entries as table rows, one column at a time.
+
+        Args:
+            report_data: Report entries of a single type
+            report_type: Report type the entries belong to
+
+        Returns:
+            List of row tuples matching the table columns
+        """
+        if report_type == "session":
+            # Slicing a short ID is a no-op, so only the suffix needs the length check
+            first_col = [e.session_id[:16] + ("..." if len(e.session_id) > 16 else "")
+                         for e in report_data]
+            second_col = [f"{e.duration_minutes:.1f}" for e in report_data]
+        elif report_type == "blocks":
+            first_col = [e.block_start.strftime('%m/%d %H:%M') for e in report_data]
+            second_col = [str(e.sessions_count) for e in report_data]
+        else:
+            first_col = [e.date.strftime('%Y-%m-%d') for e in report_data]
+            second_col = [_format_number(e.total_tokens) for e in report_data]
+
+        return list(zip(
+            first_col,
+            second_col,
+            [_format_number(e.input_tokens) for e in report_data],
+            [_format_number(e.output_tokens) for e in report_data],
+            [_format_number(e.cache_creation_tokens) for e in report_data],
+            [_format_number(e.cache_read_tokens) for e in report_data],
+            [_format_currency(e.total_cost) for e in report_data]
+        ))
 
     def _update_summary(self, records):
         """Update the summary view with statistics."""
+        # The labels already describe this exact record list
+        if records is self._summary_records:
+            return
+
         if not records:
             for label in self.summary_labels.values():
                 label.config(text="No data")
@@ -409,14 +666,20 @@ class MainApplication:
             # Calculate summary statistics
             total_records = len(records)
 
-            # Date range
-            timestamps = [r.timestamp for r in records]
-            start_date = min(timestamps)
-            end_date = max(timestamps)
-            date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+            # Date range, token totals and model usage in a single pass
+            start_date = end_date = records[0].timestamp
+            total_tokens = 0
+            model_counts: Dict[str, int] = {}
+            for r in records:
+                timestamp = r.timestamp
+                if timestamp < start_date:
+                    start_date = timestamp
+                elif timestamp > end_date:
+                    end_date = timestamp
+                total_tokens += r.total_tokens
+                model_counts[r.model] = model_counts.get(r.model, 0) + 1
 
-            # Token totals
-            total_tokens = sum(r.total_tokens for r in records)
+            date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
 
             # Cost calculation
             if self.cost_calculator:
@@ -431,9 +694,6 @@ class MainApplication:
                 avg_daily_cost = 0.0
 
             # Most used model
-            model_counts = {}
-            for r in records:
-                model_counts[r.model] = model_counts.get(r.model, 0) + 1
             top_model = max(model_counts.items(), key=lambda x: x[1])[0] if model_counts else "None"
 
             # Update labels
@@ -443,6 +703,7 @@ class MainApplication:
             self.summary_labels["total_cost"].config(text=format_currency(total_cost))
             self.summary_labels["avg_daily_cost"].config(text=format_currency(avg_daily_cost))
             self.summary_labels["top_model"].config(text=top_model)
+            self._summary_records = records
 
         except Exception as e:
             logger.error(f"Error updating summary: {e}")
@@ -470,15 +731,14 @@ class MainApplication:
 
     def _clear_filters(self):
         """Clear all filters."""
-        self.start_date_var.set("")
-        self.end_date_var.set("")
+        self.start_date_entry.delete(0, tk.END)
+        self.end_date_entry.delete(0, tk.END)
         self._generate_current_report()
 
     def _refresh_data(self):
         """Refresh data from files."""
         if self.data_loader:
-            self.data_loader.clear_cache()
-            self._load_initial_data()
+            self._load_initial_data(refresh=True)
 
     def _switch_report(self, report_type: str):
         """Switch to a different report type."""
@@ -487,13 +747,71 @@ class MainApplication:
 
     def _export_json(self):
         """Export current report to JSON."""
-        # Implementation placeholder
-        messagebox.showinfo("Export", "JSON export functionality will be implemented in next phase")
+        file_path = self._ask_export_path(".json", "JSON files")
+        if not file_path:
+            return
+
+        try:
+            export_data = self.report_generator.export_to_json(
+                self._current_report,
+                include_breakdown=self.config_manager.config.export.include_breakdown
+            )
+            # Serialize once and write in a single call
+            content = json.dumps(export_data, indent=2, ensure_ascii=False)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+            self.status_var.set(f"Exported {len(self._current_report)} entries to {file_path}")
+
+        except Exception as e:
+            logger.error(f"Error exporting JSON: {e}")
+            messagebox.showerror("Export Error", f"Failed to export JSON:\n{e}")
 
     def _export_csv(self):
         """Export current report to CSV."""
-        # Implementation placeholder
-        messagebox.showinfo("Export", "CSV export functionality will be implemented in next phase")
+        file_path = self._ask_export_path(".csv", "CSV files")
+        if not file_path:
+            return
+
+        try:
+            with open(file_path, 'w', encoding='utf-8', newline='') as f:
+                self.report_generator.export_to_csv(self._current_report, f)
+
+            self.status_var.set(f"Exported {len(self._current_report)} entries to {file_path}")
+
+        except Exception as e:
+            logger.error(f"Error exporting CSV: {e}")
+            messagebox.showerror("Export Error", f"Failed to export CSV:\n{e}")
+
+    def _ask_export_path(self, extension: str, description: str) -> Optional[str]:
+        """
+        Ask the user where to save the current report.
+
+        Args:
+            extension: File extension including the dot (e.g. '.json')
+            description: File type description for the dialog
+
+        Returns:
+            Selected file path, or None if there is nothing to export or the dialog was cancelled
+        """
+        if not self.report_generator or not self._current_report:
+            messagebox.showinfo("Export", "There is no report data to export")
+            return None
+
+        export_config = self.config_manager.config.export
+        filename = f"ccusage_{self._current_report_type}_report"
+        if export_config.timestamp_files:
+            filename += datetime.now().strftime("_%Y%m%d_%H%M%S")
+
+        file_path = filedialog.asksaveasfilename(
+            parent=self.root,
+            title="Export Report",
+            defaultextension=extension,
+            filetypes=[(description, f"*{extension}"), ("All files", "*.*")],
+            initialdir=export_config.default_directory or None,
+            initialfile=filename + extension
+        )
+        return file_path or None
 
     def _update_pricing(self):
         """Update pricing data."""
@@ -501,6 +819,10 @@ class MainApplication:
             success = self.cost_calculator.update_pricing(force=True)
             if success:
                 messagebox.showinfo("Pricing Update", "Pricing data updated successfully")
+                self._last_gen_key = None
+                self._pending_gen_key = None
+                self._report_cache.clear()
+                self._row_cache.clear()
                 self._generate_current_report()  # Refresh with new pricing
             else:
                 messagebox.showerror("Pricing Update", "Failed to update pricing data")
@@ -512,12 +834,28 @@ class MainApplication:
 
     def _show_documentation(self):
         """Show documentation in a new window."""
-        # Check if README.md exists
-        readme_path = Path.cwd() / "README.md"
-        if not readme_path.exists():
-            messagebox.showerror("Documentation", "README.md file not found")
+        # Reuse the window if it was opened before and only hidden
+        if self._doc_window is not None and self._doc_window.winfo_exists():
+            self._doc_window.deiconify()
+            self._doc_window.lift()
             return
 
+        # Load README content once and keep it for later opens
+        if self._doc_text_cache is None:
+            # Check if README.md exists
+            readme_path = Path.cwd() / "README.md"
+            if not readme_path.exists():
+                messagebox.showerror("Documentation", "README.md file not found")
+                return
+
+            try:
+                with open(readme_path, 'r', encoding='utf-8') as f:
+                    self._doc_text_cache = f.read()
+            except Exception as e:
+                logger.error(f"Error loading documentation: {e}")
+                messagebox.showerror("Documentation", f"Error loading documentation: {e}")
+                return
+
         # Create documentation window
         doc_window = tk.Toplevel(self.root)
         doc_window.title("Mr. The Guru - Claude Code Usage - Documentation")
@@ -548,14 +886,38 @@ class MainApplication:
         frame.columnconfigure(0, weight=1)
         frame.rowconfigure(0, weight=1)
 
-        # Load and display README content
-        try:
-            with open(readme_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            text_widget.insert('1.0', content)
+        # Display README content in chunks so the window paints before a large file is in
+        self._fill_doc_text(text_widget, self._doc_text_cache)
+
+        # Hide instead of destroying so reopening is instant
+        doc_window.protocol("WM_DELETE_WINDOW", doc_window.withdraw)
+        doc_window.bind('<Destroy>', self._on_doc_window_destroyed)
+        self._doc_window = doc_window
+
+    def _fill_doc_text(self, text_widget: tk.Text, content: str, start: int = 0):
+        """
+        Insert documentation text one chunk per idle callback.
+
+        Args:
+            text_widget: Text widget receiving the content
+            content: Full documentation text
+            start: Offset of the next chunk to insert
+        """
+        if not text_widget.winfo_exists():
+            return
+
+        end = start + self.DOC_CHUNK_SIZE
+        text_widget.insert('end', content[start:end])
+
+        if end < len(content):
+            text_widget.after_idle(self._fill_doc_text, text_widget, content, end)
+        else:
             text_widget.config(state='disabled')  # Make read-only
-        except Exception as e:
-            text_widget.insert('1.0', f"Error loading documentation: {e}")
+
+    def _on_doc_window_destroyed(self, event):
+        """Forget the documentation window once Tk has destroyed it."""
+        if event.widget is self._doc_window:
+            self._doc_window = None
 
     def _show_about(self):
         """Show about dialog."""
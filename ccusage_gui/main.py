@@ -3,18 +3,28 @@ Main application runner for Mr. The Guru - Claude Code Usage GUI
 """
 
 import os
+import re
 import sys
 import tkinter as tk
 from pathlib import Path
 
 from .config import ConfigManager
 from .gui import MainApplication
+from .utils import setup_logging
+
+# Pixels of a restored window that must be on screen to keep its saved position
+_MIN_VISIBLE = 50
+
+_GEOMETRY_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
 
 
 def run_app():
     """
     Initialize and run the main GUI application.
     """
+    # Configure logging once for the whole process
+    setup_logging("INFO")
+
     # Initialize configuration
     config_manager = ConfigManager()
 
@@ -35,22 +45,108 @@ def run_app():
     # Set minimum window size
     root.minsize(800, 600)
 
-    # Center window on screen
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    window_width = 1200
-    window_height = 800
+    # Restore the last window geometry; only center on screen when none is stored
+    window_state = config_manager.config.window_state
+    window_width = window_state.get("width", 1200)
+    window_height = window_state.get("height", 800)
+    x = window_state.get("x")
+    y = window_state.get("y")
 
-    x = (screen_width - window_width) // 2
-    y = (screen_height - window_height) // 2
+    # Negative offsets are valid (monitors left of or above the primary), so only a
+    # missing position or one no longer on any screen falls back to centering
+    if x is None or y is None or not _is_on_screen(root, x, y, window_width, window_height):
+        screen_width = root.winfo_screenwidth()
+        screen_height = root.winfo_screenheight()
+        x = (screen_width - window_width) // 2
+        y = (screen_height - window_height) // 2
     root.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
+    if window_state.get("maximized"):
+        try:
+            root.state('zoomed')
+        except tk.TclError:
+            pass  # 'zoomed' is not supported by every window manager
+
+    # Apply the ttk theme once, before any themed widget is created
+    MainApplication.init_style()
+
     # Create main application
     app = MainApplication(root, config_manager)
 
+    # Remember the window geometry when the window is closed
+    def on_close():
+        _save_window_state(root, config_manager)
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
     # Start the GUI event loop
     root.mainloop()
 
+    # File > Exit leaves the main loop without closing the window
+    try:
+        if root.winfo_exists():
+            _save_window_state(root, config_manager)
+    except tk.TclError:
+        pass  # Window was already destroyed by on_close
+
+
+def _is_on_screen(root: tk.Tk, x: int, y: int, width: int, height: int) -> bool:
+    """
+    Check whether a saved window rectangle is still reachable on the desktop.
+
+    Uses the virtual root, which spans all monitors on Windows. The window must
+    show a strip of at least _MIN_VISIBLE pixels, with its top edge (title bar)
+    inside the desktop so it can still be dragged.
+
+    Args:
+        root: Tkinter root window
+        x: Saved left edge
+        y: Saved top edge
+        width: Saved window width
+        height: Saved window height
+
+    Returns:
+        True if the window would be at least partly visible
+    """
+    left = root.winfo_vrootx()
+    top = root.winfo_vrooty()
+    right = left + (root.winfo_vrootwidth() or root.winfo_screenwidth())
+    bottom = top + (root.winfo_vrootheight() or root.winfo_screenheight())
+
+    return (x + width >= left + _MIN_VISIBLE and x <= right - _MIN_VISIBLE and
+            top <= y <= bottom - _MIN_VISIBLE)
+
+
+def _save_window_state(root: tk.Tk, config_manager: ConfigManager):
+    """
+    Store the window size and position in the configuration.
+
+    Args:
+        root: Tkinter root window
+        config_manager: Configuration manager to save the state to
+    """
+    window_state = config_manager.config.window_state
+
+    if root.state() == 'zoomed':
+        # Keep the last normal geometry so un-maximizing restores it
+        config_manager.update_window_state(
+            window_state.get("width", 1200),
+            window_state.get("height", 800),
+            window_state.get("x"),
+            window_state.get("y"),
+            maximized=True
+        )
+        return
+
+    # wm geometry is reported as "WIDTHxHEIGHT+X+Y" (offsets may be negative)
+    match = _GEOMETRY_RE.match(root.geometry())
+    if not match:
+        return
+
+    width, height, x, y = (int(value) for value in match.groups())
+    config_manager.update_window_state(width, height, x, y, maximized=False)
+
 
 if __name__ == "__main__":
     run_app()
\ No newline at end of file
@@ -5,10 +5,14 @@ Generates various types of usage reports based on Claude Code data.
 Supports daily, monthly, weekly, session, and blocks reports.
 """
 
+import csv
 import logging
+from io import StringIO
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, NamedTuple, Any
+from typing import Dict, List, Optional, NamedTuple, Any, TextIO, Tuple, Callable
 from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from itertools import groupby, islice
 from dataclasses import dataclass
 import calendar
 
@@ -17,8 +21,11 @@ from .cost_calculator import CostCalculator
 
 logger = logging.getLogger(__name__)
 
+# Proleptic Gregorian ordinal of 1970-01-01, the origin of block numbers
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
 
-@dataclass
+
+@dataclass(slots=True)
 class ReportEntry:
     """Base class for report entries."""
     date: datetime
@@ -32,7 +39,7 @@ class ReportEntry:
     record_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionReportEntry:
     """Report entry for session-based reports."""
     session_id: str
@@ -51,7 +58,7 @@ class SessionReportEntry:
     project_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockReportEntry:
     """Report entry for 5-hour blocks reports."""
     block_start: datetime
@@ -89,6 +96,9 @@ class ReportGenerator:
         """
         self.cost_calculator = cost_calculator
 
+        # (records, record count, timestamps or None if unsorted) of the last filtered list
+        self._timestamp_index: Optional[tuple] = None
+
     def generate_daily_report(self,
                             records: List[UsageRecord],
                             start_date: Optional[datetime] = None,
@@ -107,26 +117,25 @@ class ReportGenerator:
             List of daily report entries
         """
         # Filter records by date range
-        filtered_records = self._filter_by_date_range(records, start_date, end_date)
+        filtered_records, is_sorted = self._filter_by_date_range(records, start_date, end_date)
 
-        # Group by date
-        daily_groups = defaultdict(list)
-        for record in filtered_records:
-            date_key = record.timestamp.date()
-            daily_groups[date_key].append(record)
+        # Group by date, keyed by the day's proleptic ordinal
+        daily_groups, in_order = self._group_records(
+            filtered_records, lambda r: r.timestamp.toordinal(), is_sorted
+        )
 
         # Generate report entries
         report_entries = []
-        for date, day_records in daily_groups.items():
-            entry = self._create_report_entry(
-                datetime.combine(date, datetime.min.time()),
-                day_records
-            )
+        for day, day_records in daily_groups.items():
+            entry = self._create_report_entry(datetime.fromordinal(day), day_records)
             report_entries.append(entry)
 
-        # Sort by date
+        # Sort by date unless the groups already came out ascending
         reverse = (order == "desc")
-        report_entries.sort(key=lambda x: x.date, reverse=reverse)
+        if not in_order:
+            report_entries.sort(key=lambda x: x.date, reverse=reverse)
+        elif reverse:
+            report_entries.reverse()
 
         return report_entries
 
@@ -148,13 +157,12 @@ class ReportGenerator:
             List of monthly report entries
         """
         # Filter records by date range
-        filtered_records = self._filter_by_date_range(records, start_date, end_date)
+        filtered_records, is_sorted = self._filter_by_date_range(records, start_date, end_date)
 
         # Group by month
-        monthly_groups = defaultdict(list)
-        for record in filtered_records:
-            month_key = (record.timestamp.year, record.timestamp.month)
-            monthly_groups[month_key].append(record)
+        monthly_groups, in_order = self._group_records(
+            filtered_records, lambda r: (r.timestamp.year, r.timestamp.month), is_sorted
+        )
 
         # Generate report entries
         report_entries = []
@@ -163,9 +171,12 @@ class ReportGenerator:
             entry = self._create_report_entry(month_start, month_records)
             report_entries.append(entry)
 
-        # Sort by date
+        # Sort by date unless the groups already came out ascending
         reverse = (order == "desc")
-        report_entries.sort(key=lambda x: x.date, reverse=reverse)
+        if not in_order:
+            report_entries.sort(key=lambda x: x.date, reverse=reverse)
+        elif reverse:
+            report_entries.reverse()
 
         return report_entries
 
@@ -189,23 +200,28 @@ class ReportGenerator:
             List of weekly report entries
         """
         # Filter records by date range
-        filtered_records = self._filter_by_date_range(records, start_date, end_date)
+        filtered_records, is_sorted = self._filter_by_date_range(records, start_date, end_date)
 
-        # Group by week
-        weekly_groups = defaultdict(list)
-        for record in filtered_records:
-            week_start = self._get_week_start(record.timestamp, week_start_day)
-            weekly_groups[week_start].append(record)
+        # Group by week, keyed by the proleptic ordinal of the week's first day
+        # (date.weekday() == (ordinal - 1) % 7)
+        def week_key(record: UsageRecord) -> int:
+            day = record.timestamp.toordinal()
+            return day - (day - 1 - week_start_day) % 7
+
+        weekly_groups, in_order = self._group_records(filtered_records, week_key, is_sorted)
 
         # Generate report entries
         report_entries = []
-        for week_start, week_records in weekly_groups.items():
-            entry = self._create_report_entry(week_start, week_records)
+        for week_ordinal, week_records in weekly_groups.items():
+            entry = self._create_report_entry(datetime.fromordinal(week_ordinal), week_records)
             report_entries.append(entry)
 
-        # Sort by date
+        # Sort by date unless the groups already came out ascending
         reverse = (order == "desc")
-        report_entries.sort(key=lambda x: x.date, reverse=reverse)
+        if not in_order:
+            report_entries.sort(key=lambda x: x.date, reverse=reverse)
+        elif reverse:
+            report_entries.reverse()
 
         return report_entries
 
@@ -227,7 +243,7 @@ class ReportGenerator:
             List of session report entries
         """
         # Filter records by date range
-        filtered_records = self._filter_by_date_range(records, start_date, end_date)
+        filtered_records, _ = self._filter_by_date_range(records, start_date, end_date)
 
         # Group by session
         session_groups = defaultdict(list)
@@ -237,31 +253,39 @@ class ReportGenerator:
         # Generate session entries
         session_entries = []
         for session_id, session_records in session_groups.items():
-            # Sort records by timestamp
-            session_records.sort(key=lambda x: x.timestamp)
+            # First/last activity, totals and models in a single pass
+            first_record = session_records[0]
+            start_time = end_time = first_record.timestamp
+            input_tokens = output_tokens = cache_creation_tokens = cache_read_tokens = 0
+            models_seen = {}
+
+            for record in session_records:
+                timestamp = record.timestamp
+                if timestamp < start_time:
+                    start_time = timestamp
+                    first_record = record
+                elif timestamp > end_time:
+                    end_time = timestamp
+
+                input_tokens += record.input_tokens
+                output_tokens += record.output_tokens
+                cache_creation_tokens += record.cache_creation_tokens
+                cache_read_tokens += record.cache_read_tokens
+                models_seen[record.model] = None
 
-            # Calculate session metrics
-            start_time = session_records[0].timestamp
-            end_time = session_records[-1].timestamp
             duration = (end_time - start_time).total_seconds() / 60  # minutes
-
-            # Calculate totals
-            total_tokens = sum(r.total_tokens for r in session_records)
-            input_tokens = sum(r.input_tokens for r in session_records)
-            output_tokens = sum(r.output_tokens for r in session_records)
-            cache_creation_tokens = sum(r.cache_creation_tokens for r in session_records)
-            cache_read_tokens = sum(r.cache_read_tokens for r in session_records)
+            total_tokens = input_tokens + output_tokens + cache_creation_tokens + cache_read_tokens
 
             # Calculate cost
             cost_breakdown = self.cost_calculator.calculate_total_cost(session_records)
             total_cost = cost_breakdown['total_cost']
 
-            # Get unique models
-            models_used = list(set(r.model for r in session_records))
+            # Get unique models in order of first use
+            models_used = list(models_seen)
 
             # Get project info (use first record's project info)
-            project_id = session_records[0].project_id
-            project_name = session_records[0].project_name
+            project_id = first_record.project_id
+            project_name = first_record.project_name
 
             entry = SessionReportEntry(
                 session_id=session_id,
@@ -306,38 +330,50 @@ class ReportGenerator:
             List of 5-hour block report entries
         """
         # Filter records by date range
-        filtered_records = self._filter_by_date_range(records, start_date, end_date)
+        filtered_records, is_sorted = self._filter_by_date_range(records, start_date, end_date)
 
-        # Group by 5-hour blocks
-        block_groups = defaultdict(list)
-        for record in filtered_records:
-            block_start = self._get_block_start(record.timestamp)
-            block_groups[block_start].append(record)
+        # Group by 5-hour blocks, keyed by the block's first hour counted from the
+        # proleptic ordinal; blocks start at 00, 05, 10, 15 and 20 each day
+        def block_key(record: UsageRecord) -> int:
+            timestamp = record.timestamp
+            hour = timestamp.hour
+            return timestamp.toordinal() * 24 + hour - hour % 5
+
+        block_groups, in_order = self._group_records(filtered_records, block_key, is_sorted)
 
         # Generate block entries
         block_entries = []
         current_time = datetime.now()
+        epoch_hours = _EPOCH_ORDINAL * 24
 
-        for block_start, block_records in block_groups.items():
+        for block_hours, block_records in block_groups.items():
+            day, block_hour = divmod(block_hours, 24)
+            block_start = datetime.fromordinal(day).replace(hour=block_hour)
             block_end = block_start + timedelta(hours=5)
 
-            # Calculate session metrics
-            session_ids = set(r.session_id for r in block_records)
-            sessions_count = len(session_ids)
+            # Sessions, first/last activity and totals in a single pass
+            first_activity = last_activity = block_records[0].timestamp
+            input_tokens = output_tokens = cache_creation_tokens = cache_read_tokens = 0
+            session_ids = set()
 
-            # Calculate active duration (time between first and last activity)
-            if len(block_records) > 1:
-                sorted_records = sorted(block_records, key=lambda x: x.timestamp)
-                active_duration = (sorted_records[-1].timestamp - sorted_records[0].timestamp).total_seconds() / 60
-            else:
-                active_duration = 0.0
+            for record in block_records:
+                timestamp = record.timestamp
+                if timestamp < first_activity:
+                    first_activity = timestamp
+                elif timestamp > last_activity:
+                    last_activity = timestamp
+
+                input_tokens += record.input_tokens
+                output_tokens += record.output_tokens
+                cache_creation_tokens += record.cache_creation_tokens
+                cache_read_tokens += record.cache_read_tokens
+                session_ids.add(record.session_id)
 
-            # Calculate totals
-            total_tokens = sum(r.total_tokens for r in block_records)
-            input_tokens = sum(r.input_tokens for r in block_records)
-            output_tokens = sum(r.output_tokens for r in block_records)
-            cache_creation_tokens = sum(r.cache_creation_tokens for r in block_records)
-            cache_read_tokens = sum(r.cache_read_tokens for r in block_records)
+            sessions_count = len(session_ids)
+            total_tokens = input_tokens + output_tokens + cache_creation_tokens + cache_read_tokens
+
+            # Active duration is the time between first and last activity
+            active_duration = (last_activity - first_activity).total_seconds() / 60
 
             # Calculate cost
             cost_breakdown = self.cost_calculator.calculate_total_cost(block_records)
@@ -347,9 +383,7 @@ class ReportGenerator:
             is_current = block_start <= current_time < block_end
 
             # Calculate block number (hours since epoch / 5)
-            epoch = datetime(1970, 1, 1)
-            hours_since_epoch = (block_start - epoch).total_seconds() / 3600
-            block_number = int(hours_since_epoch // 5)
+            block_number = (block_hours - epoch_hours) // 5
 
             entry = BlockReportEntry(
                 block_start=block_start,
@@ -368,17 +402,34 @@ class ReportGenerator:
 
             block_entries.append(entry)
 
-        # Sort by block start time
+        # Sort by block start time unless the groups already came out ascending
         reverse = (order == "desc")
-        block_entries.sort(key=lambda x: x.block_start, reverse=reverse)
+        if not in_order:
+            block_entries.sort(key=lambda x: x.block_start, reverse=reverse)
+        elif reverse:
+            block_entries.reverse()
 
         return block_entries
 
     def _filter_by_date_range(self,
                             records: List[UsageRecord],
                             start_date: Optional[datetime],
-                            end_date: Optional[datetime]) -> List[UsageRecord]:
-        """Filter records by date range."""
+                            end_date: Optional[datetime]) -> Tuple[List[UsageRecord], bool]:
+        """
+        Filter records by date range.
+
+        Returns:
+            Tuple of (filtered records, whether they are sorted by timestamp)
+        """
+        # Sorted input (as returned by DataLoader) can be sliced with a binary search
+        timestamps = self._get_sorted_timestamps(records)
+        if timestamps is not None:
+            if not start_date and not end_date:
+                return records, True
+            lo = bisect_left(timestamps, start_date) if start_date else 0
+            hi = bisect_right(timestamps, end_date) if end_date else len(timestamps)
+            return records[lo:hi], True
+
         filtered = records
 
         if start_date:
@@ -387,84 +438,150 @@ class ReportGenerator:
         if end_date:
             filtered = [r for r in filtered if r.timestamp <= end_date]
 
-        return filtered
+        return filtered, False
+
+    def _group_records(self,
+                       records: List[UsageRecord],
+                       key: Callable[[UsageRecord], Any],
+                       is_sorted: bool) -> Tuple[Dict[Any, List[UsageRecord]], bool]:
+        """
+        Group records by key, keeping groups in first-seen order.
+
+        Args:
+            records: Usage records to group
+            key: Function returning the group key of a record
+            is_sorted: Whether records are sorted by timestamp, so that
+                time-based keys usually arrive in contiguous runs
+
+        Returns:
+            Tuple of (dictionary mapping each key to its records, whether the
+            groups are in ascending key order)
+        """
+        if is_sorted:
+            groups = {}
+            ascending = True
+            previous_key = None
+            for group_key, run in groupby(records, key):
+                # Keys come from each record's wall-clock fields, so records with
+                # different UTC offsets can step a key backwards or repeat it
+                existing = groups.get(group_key)
+                if existing is None:
+                    if previous_key is not None and group_key < previous_key:
+                        ascending = False
+                    groups[group_key] = list(run)
+                else:
+                    ascending = False
+                    existing.extend(run)
+                previous_key = group_key
+            return groups, ascending
+
+        groups = defaultdict(list)
+        for record in records:
+            groups[key(record)].append(record)
+        return groups, False
+
+    def _get_sorted_timestamps(self, records: List[UsageRecord]) -> Optional[List[datetime]]:
+        """
+        Get the record timestamps if the records are sorted by timestamp.
+
+        The result is remembered for the last record list, since every report
+        type filters the same loaded records.
+
+        Args:
+            records: Usage records to index
+
+        Returns:
+            List of timestamps in record order, or None if the records are unsorted
+        """
+        index = self._timestamp_index
+        if index is not None and index[0] is records and index[1] == len(records):
+            return index[2]
+
+        timestamps = [r.timestamp for r in records]
+        if any(a > b for a, b in zip(timestamps, islice(timestamps, 1, None))):
+            timestamps = None
+
+        # Single assignment so report threads never see a half-updated index
+        self._timestamp_index = (records, len(records), timestamps)
+        return timestamps
 
     def _create_report_entry(self, date: datetime, records: List[UsageRecord]) -> ReportEntry:
         """Create a report entry from a group of records."""
-        # Calculate totals
-        total_tokens = sum(r.total_tokens for r in records)
-        input_tokens = sum(r.input_tokens for r in records)
-        output_tokens = sum(r.output_tokens for r in records)
-        cache_creation_tokens = sum(r.cache_creation_tokens for r in records)
-        cache_read_tokens = sum(r.cache_read_tokens for r in records)
-
-        # Calculate cost
-        cost_breakdown = self.cost_calculator.calculate_total_cost(records)
-        total_cost = cost_breakdown['total_cost']
-
-        # Create model breakdown
-        model_breakdown = defaultdict(lambda: {
-            'tokens': 0,
-            'input_tokens': 0,
-            'output_tokens': 0,
-            'cache_creation_tokens': 0,
-            'cache_read_tokens': 0,
-            'cost': 0.0,
-            'count': 0
-        })
+        # Totals and model breakdown in a single pass
+        input_tokens = output_tokens = cache_creation_tokens = cache_read_tokens = 0
+        model_breakdown = {}
 
         for record in records:
+            inp = record.input_tokens
+            out = record.output_tokens
+            cache_creation = record.cache_creation_tokens
+            cache_read = record.cache_read_tokens
+
+            input_tokens += inp
+            output_tokens += out
+            cache_creation_tokens += cache_creation
+            cache_read_tokens += cache_read
+
             model = record.model
-            model_breakdown[model]['tokens'] += record.total_tokens
-            model_breakdown[model]['input_tokens'] += record.input_tokens
-            model_breakdown[model]['output_tokens'] += record.output_tokens
-            model_breakdown[model]['cache_creation_tokens'] += record.cache_creation_tokens
-            model_breakdown[model]['cache_read_tokens'] += record.cache_read_tokens
-            model_breakdown[model]['count'] += 1
-
-            # Calculate cost for this record
-            cost_calc = self.cost_calculator.calculate_cost(record)
+            breakdown = model_breakdown.get(model)
+            if breakdown is None:
+                breakdown = model_breakdown[model] = {
+                    'tokens': 0,
+                    'input_tokens': 0,
+                    'output_tokens': 0,
+                    'cache_creation_tokens': 0,
+                    'cache_read_tokens': 0,
+                    'cost': 0.0,
+                    'count': 0
+                }
+            breakdown['tokens'] += inp + out + cache_creation + cache_read
+            breakdown['input_tokens'] += inp
+            breakdown['output_tokens'] += out
+            breakdown['cache_creation_tokens'] += cache_creation
+            breakdown['cache_read_tokens'] += cache_read
+            breakdown['count'] += 1
+
+        # Cost is linear in tokens, so price each model's totals once
+        calculate_cost = self.cost_calculator.calculate_cost_from_totals
+        total_cost = 0.0
+        failed_calculations = 0
+        for model, breakdown in model_breakdown.items():
+            cost_calc = calculate_cost(
+                model,
+                breakdown['input_tokens'],
+                breakdown['output_tokens'],
+                breakdown['cache_creation_tokens'],
+                breakdown['cache_read_tokens']
+            )
             if cost_calc:
-                model_breakdown[model]['cost'] += cost_calc.total_cost
+                breakdown['cost'] = cost_calc.total_cost
+                total_cost += cost_calc.total_cost
+            else:
+                failed_calculations += breakdown['count']
+
+        if failed_calculations > 0:
+            logger.warning(f"Failed to calculate costs for {failed_calculations} records")
 
         return ReportEntry(
             date=date,
-            total_tokens=total_tokens,
+            total_tokens=input_tokens + output_tokens + cache_creation_tokens + cache_read_tokens,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             cache_creation_tokens=cache_creation_tokens,
             cache_read_tokens=cache_read_tokens,
             total_cost=total_cost,
-            model_breakdown=dict(model_breakdown),
+            model_breakdown=model_breakdown,
             record_count=len(records)
         )
 
-    def _get_week_start(self, date: datetime, week_start_day: int) -> datetime:
-        """Get the start of the week for a given date."""
-        days_since_start = (date.weekday() - week_start_day) % 7
-        week_start = date - timedelta(days=days_since_start)
-        return datetime.combine(week_start.date(), datetime.min.time())
-
-    def _get_block_start(self, timestamp: datetime) -> datetime:
-        """Get the start of the 5-hour block for a given timestamp."""
-        # Round down to the nearest 5-hour boundary
-        hour = timestamp.hour
-        block_hour = (hour // 5) * 5
-
-        return datetime(
-            timestamp.year,
-            timestamp.month,
-            timestamp.day,
-            block_hour,
-            0, 0
-        )
-
-    def export_to_json(self, report_data: List[Any]) -> Dict[str, Any]:
+    def export_to_json(self, report_data: List[Any], include_breakdown: bool = True) -> Dict[str, Any]:
         """
         Export report data to JSON format.
 
         Args:
             report_data: Report entries to export
+            include_breakdown: Whether to include the per-model breakdown of
+                daily/weekly/monthly entries
 
         Returns:
             Dictionary suitable for JSON serialization
@@ -476,74 +593,102 @@ class ReportGenerator:
             'entries': []
         }
 
-        for entry in report_data:
-            if isinstance(entry, ReportEntry):
-                export_data['entries'].append({
-                    'date': entry.date.isoformat(),
-                    'total_tokens': entry.total_tokens,
-                    'input_tokens': entry.input_tokens,
-                    'output_tokens': entry.output_tokens,
-                    'cache_creation_tokens': entry.cache_creation_tokens,
-                    'cache_read_tokens': entry.cache_read_tokens,
-                    'total_cost': entry.total_cost,
-                    'model_breakdown': entry.model_breakdown,
-                    'record_count': entry.record_count
-                })
-
-            elif isinstance(entry, SessionReportEntry):
-                export_data['entries'].append({
-                    'session_id': entry.session_id,
-                    'start_time': entry.start_time.isoformat(),
-                    'end_time': entry.end_time.isoformat(),
-                    'duration_minutes': entry.duration_minutes,
-                    'total_tokens': entry.total_tokens,
-                    'input_tokens': entry.input_tokens,
-                    'output_tokens': entry.output_tokens,
-                    'cache_creation_tokens': entry.cache_creation_tokens,
-                    'cache_read_tokens': entry.cache_read_tokens,
-                    'total_cost': entry.total_cost,
-                    'models_used': entry.models_used,
-                    'message_count': entry.message_count,
-                    'project_id': entry.project_id,
-                    'project_name': entry.project_name
-                })
-
-            elif isinstance(entry, BlockReportEntry):
-                export_data['entries'].append({
-                    'block_start': entry.block_start.isoformat(),
-                    'block_end': entry.block_end.isoformat(),
-                    'block_number': entry.block_number,
-                    'total_tokens': entry.total_tokens,
-                    'input_tokens': entry.input_tokens,
-                    'output_tokens': entry.output_tokens,
-                    'cache_creation_tokens': entry.cache_creation_tokens,
-                    'cache_read_tokens': entry.cache_read_tokens,
-                    'total_cost': entry.total_cost,
-                    'sessions_count': entry.sessions_count,
-                    'active_duration_minutes': entry.active_duration_minutes,
-                    'is_current_block': entry.is_current_block
-                })
-
+        if not report_data:
+            return export_data
+
+        # A report holds a single entry type, so pick the converter once
+        first = report_data[0]
+        if isinstance(first, ReportEntry):
+            to_dict = self._report_entry_to_dict
+        elif isinstance(first, SessionReportEntry):
+            to_dict = self._session_entry_to_dict
+        elif isinstance(first, BlockReportEntry):
+            to_dict = self._block_entry_to_dict
+        else:
+            return export_data
+
+        entries = [to_dict(entry) for entry in report_data]
+        if not include_breakdown and to_dict is self._report_entry_to_dict:
+            for entry in entries:
+                del entry['model_breakdown']
+
+        export_data['entries'] = entries
         return export_data
 
-    def export_to_csv(self, report_data: List[Any]) -> str:
+    @staticmethod
+    def _report_entry_to_dict(entry: ReportEntry) -> Dict[str, Any]:
+        """Convert a daily/weekly/monthly entry to a JSON-serializable dict."""
+        return {
+            'date': entry.date.isoformat(),
+            'total_tokens': entry.total_tokens,
+            'input_tokens': entry.input_tokens,
+            'output_tokens': entry.output_tokens,
+            'cache_creation_tokens': entry.cache_creation_tokens,
+            'cache_read_tokens': entry.cache_read_tokens,
+            'total_cost': entry.total_cost,
+            'model_breakdown': entry.model_breakdown,
+            'record_count': entry.record_count
+        }
+
+    @staticmethod
+    def _session_entry_to_dict(entry: SessionReportEntry) -> Dict[str, Any]:
+        """Convert a session entry to a JSON-serializable dict."""
+        return {
+            'session_id': entry.session_id,
+            'start_time': entry.start_time.isoformat(),
+            'end_time': entry.end_time.isoformat(),
+            'duration_minutes': entry.duration_minutes,
+            'total_tokens': entry.total_tokens,
+            'input_tokens': entry.input_tokens,
+            'output_tokens': entry.output_tokens,
+            'cache_creation_tokens': entry.cache_creation_tokens,
+            'cache_read_tokens': entry.cache_read_tokens,
+            'total_cost': entry.total_cost,
+            'models_used': entry.models_used,
+            'message_count': entry.message_count,
+            'project_id': entry.project_id,
+            'project_name': entry.project_name
+        }
+
+    @staticmethod
+    def _block_entry_to_dict(entry: BlockReportEntry) -> Dict[str, Any]:
+        """Convert a 5-hour block entry to a JSON-serializable dict."""
+        return {
+            'block_start': entry.block_start.isoformat(),
+            'block_end': entry.block_end.isoformat(),
+            'block_number': entry.block_number,
+            'total_tokens': entry.total_tokens,
+            'input_tokens': entry.input_tokens,
+            'output_tokens': entry.output_tokens,
+            'cache_creation_tokens': entry.cache_creation_tokens,
+            'cache_read_tokens': entry.cache_read_tokens,
+            'total_cost': entry.total_cost,
+            'sessions_count': entry.sessions_count,
+            'active_duration_minutes': entry.active_duration_minutes,
+            'is_current_block': entry.is_current_block
+        }
+
+    def export_to_csv(self, report_data: List[Any], out: Optional[TextIO] = None) -> Optional[str]:
         """
         Export report data to CSV format.
 
         Args:
             report_data: Report entries to export
+            out: Text stream to write to (opened with newline=''); if omitted,
+                the CSV is built in memory and returned
 
         Returns:
-            CSV string
+            CSV string, or None when written to ``out``
         """
-        if not report_data:
-            return ""
+        if out is None:
+            buffer = StringIO()
+            self.export_to_csv(report_data, buffer)
+            return buffer.getvalue()
 
-        import csv
-        from io import StringIO
+        if not report_data:
+            return None
 
-        output = StringIO()
-        writer = csv.writer(output)
+        writer = csv.writer(out)
 
         # Write headers based on report type
         if isinstance(report_data[0], ReportEntry):
@@ -553,9 +698,8 @@ class ReportGenerator:
                 'Record Count', 'Models Used'
             ])
 
-            for entry in report_data:
-                models_used = ', '.join(entry.model_breakdown.keys())
-                writer.writerow([
+            writer.writerows(
+                (
                     entry.date.strftime('%Y-%m-%d'),
                     entry.total_tokens,
                     entry.input_tokens,
@@ -564,8 +708,10 @@ class ReportGenerator:
                     entry.cache_read_tokens,
                     f"{entry.total_cost:.6f}",
                     entry.record_count,
-                    models_used
-                ])
+                    ', '.join(entry.model_breakdown)
+                )
+                for entry in report_data
+            )
 
         elif isinstance(report_data[0], SessionReportEntry):
             writer.writerow([
@@ -575,8 +721,8 @@ class ReportGenerator:
                 'Models Used', 'Message Count', 'Project ID', 'Project Name'
             ])
 
-            for entry in report_data:
-                writer.writerow([
+            writer.writerows(
+                (
                     entry.session_id,
                     entry.start_time.strftime('%Y-%m-%d %H:%M:%S'),
                     entry.end_time.strftime('%Y-%m-%d %H:%M:%S'),
@@ -591,7 +737,9 @@ class ReportGenerator:
                     entry.message_count,
                     entry.project_id or '',
                     entry.project_name or ''
-                ])
+                )
+                for entry in report_data
+            )
 
         elif isinstance(report_data[0], BlockReportEntry):
             writer.writerow([
@@ -601,8 +749,8 @@ class ReportGenerator:
                 'Active Duration (min)', 'Is Current Block'
             ])
 
-            for entry in report_data:
-                writer.writerow([
+            writer.writerows(
+                (
                     entry.block_start.strftime('%Y-%m-%d %H:%M:%S'),
                     entry.block_end.strftime('%Y-%m-%d %H:%M:%S'),
                     entry.block_number,
@@ -615,6 +763,8 @@ class ReportGenerator:
                     entry.sessions_count,
                     f"{entry.active_duration_minutes:.2f}",
                     entry.is_current_block
-                ])
+                )
+                for entry in report_data
+            )
 
-        return output.getvalue()
\ No newline at end of file
+        return None
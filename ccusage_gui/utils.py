@@ -7,11 +7,174 @@ Common utility functions used throughout the application.
 import os
 import sys
 import json
+import queue
+import fnmatch
+import time
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 from datetime import datetime, timezone
 import re
+from functools import lru_cache
+
+
+# Shapes accepted by parse_date_string: date, optionally followed by a time
+_DATE_RE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:([ T])(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z)?)?',
+    re.ASCII
+)
+
+# Upper bound on threads used for concurrent file I/O
+_MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_T = TypeVar('_T')
+
+# Display symbols for known currency codes; other codes are shown as-is
+_CURRENCY_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥"
+}
+
+# Units used by format_file_size, each 1024 times the previous one
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Characters not allowed in Windows file names, each mapped to '_'
+_FILENAME_TRANS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Anything sanitize_filename would change: invalid characters or a
+# leading/trailing space or dot
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]|\A[ .]|[ .]\Z')
+
+# HTML special characters and their escaped forms
+_HTML_SPECIAL_RE = re.compile('[&<>"\']')
+_HTML_TRANS = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+
+# Background writer for the log file, replaced on each setup_logging call
+_log_listener: Optional[QueueListener] = None
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that lets the file buffer coalesce log writes.
+
+    logging.FileHandler flushes after every record, costing one write call
+    per line. This handler flushes during emit only for records at or above
+    flush_level, or once flush_interval seconds have passed since the last
+    flush. Records followed by silence stay buffered until flush() is called,
+    so pair it with FlushingQueueListener (as setup_logging does) to bound
+    the delay; closing the handler flushes whatever is still buffered.
+    """
+
+    def __init__(self,
+                 filename: Union[str, Path],
+                 mode: str = 'a',
+                 encoding: Optional[str] = None,
+                 delay: bool = False,
+                 flush_level: int = logging.ERROR,
+                 flush_interval: float = 1.0,
+                 buffer_size: int = 65536):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Log file path
+            mode: File open mode
+            encoding: File encoding
+            delay: Defer opening the file until the first record
+            flush_level: Records at or above this level are flushed immediately
+            flush_interval: Seconds after the last flush at which emit flushes again
+            buffer_size: Size of the file buffer in bytes
+        """
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self._last_flush = time.monotonic()
+        self._defer_flush = False
+        super().__init__(filename, mode, encoding, delay)
+
+    def _open(self):
+        """Open the log file with a larger write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord):
+        """Write a record, flushing only when it is due."""
+        # Called with the handler lock held, so the flag cannot leak to other threads
+        self._defer_flush = (record.levelno < self.flush_level and
+                             time.monotonic() - self._last_flush < self.flush_interval)
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self):
+        """Flush the file buffer unless emit is deferring it."""
+        if self._defer_flush:
+            return
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    Queue listener that flushes its handlers once the queue has been idle.
+
+    QueueListener blocks on the queue indefinitely, so records written to a
+    buffering handler just before a quiet period would otherwise sit in the
+    buffer. Waiting with a timeout lets the listener flush them within
+    flush_interval seconds.
+    """
+
+    def __init__(self, log_queue, *handlers, respect_handler_level: bool = False,
+                 flush_interval: float = 1.0):
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue: Queue the records are read from
+            *handlers: Handlers that process the records
+            respect_handler_level: Skip records below each handler's level
+            flush_interval: Seconds without records after which handlers are flushed
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Wait for the next record, flushing the handlers whenever the wait times out."""
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
+def _stop_log_listener():
+    """Flush queued log records to disk and stop the log file writer thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
 
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
@@ -31,6 +194,7 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> loggin
 
     # Clear any existing handlers
     logger.handlers.clear()
+    _stop_log_listener()
 
     # Create formatter
     formatter = logging.Formatter(
@@ -45,9 +209,19 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> loggin
     # File handler if specified
     if log_file:
         try:
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler = BufferedFileHandler(log_file, encoding='utf-8')
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+
+            # Log calls only enqueue; a background thread does the file writes and
+            # flushes buffered lines once no new record arrived for flush_interval
+            log_queue = queue.SimpleQueue()
+            listener = FlushingQueueListener(log_queue, file_handler, respect_handler_level=True,
+                                             flush_interval=file_handler.flush_interval)
+            listener.start()
+
+            global _log_listener
+            _log_listener = listener
+            logger.addHandler(QueueHandler(log_queue))
         except Exception as e:
             logger.warning(f"Could not create log file {log_file}: {e}")
 
@@ -67,13 +241,12 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
+    # Unit index is floor(log1024(size)), read off the bit length of the integer part
     i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes >= 1024:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 def format_number(number: Union[int, float], precision: int = 2) -> str:
@@ -88,7 +261,7 @@ def format_number(number: Union[int, float], precision: int = 2) -> str:
         Formatted number string
     """
     if isinstance(number, float):
-        return f"{number:,.{precision}f}"
+        return format(number, _grouped_float_spec(precision))
     return f"{number:,}"
 
 
@@ -104,15 +277,14 @@ def format_currency(amount: float, currency: str = "USD", precision: int = 2) ->
     Returns:
         Formatted currency string
     """
-    symbol_map = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "JPY": "¥"
-    }
+    symbol = _CURRENCY_SYMBOLS.get(currency, currency)
+    return symbol + format(amount, _grouped_float_spec(precision))
+
 
-    symbol = symbol_map.get(currency, currency)
-    return f"{symbol}{amount:,.{precision}f}"
+@lru_cache(maxsize=None)
+def _grouped_float_spec(precision: int) -> str:
+    """Build the format spec for a thousands-grouped float once per precision."""
+    return f",.{precision}f"
 
 
 def format_percentage(value: float, precision: int = 1) -> str:
@@ -162,6 +334,11 @@ def parse_date_string(date_str: str) -> Optional[datetime]:
     Returns:
         Parsed datetime object or None if parsing fails
     """
+    # Fast path for the common shapes; anything else goes through strptime
+    parsed = _parse_date_fast(date_str)
+    if parsed is not None:
+        return parsed
+
     formats = [
         "%Y-%m-%d",
         "%Y%m%d",
@@ -180,6 +357,44 @@ def parse_date_string(date_str: str) -> Optional[datetime]:
     return None
 
 
+def _parse_date_fast(date_str: str) -> Optional[datetime]:
+    """
+    Parse the formats accepted by parse_date_string without strptime.
+
+    Args:
+        date_str: Date string to parse
+
+    Returns:
+        Parsed datetime object, or None if the string needs the slow path
+    """
+    if len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+        year, month, day = date_str[:4], date_str[4:6], date_str[6:]
+        hour = minute = second = fraction = None
+    else:
+        match = _DATE_RE.fullmatch(date_str)
+        if not match:
+            return None
+
+        year, month, day, sep, hour, minute, second, fraction, zulu = match.groups()
+        # Mirror the strptime formats: a space allows neither 'Z' nor fractions,
+        # and fractional seconds are only accepted with a trailing 'Z'
+        if sep == ' ' and (fraction or zulu):
+            return None
+        if fraction and not zulu:
+            return None
+
+    try:
+        if hour is None:
+            return datetime(int(year), int(month), int(day))
+        return datetime(
+            int(year), int(month), int(day),
+            int(hour), int(minute), int(second),
+            int(fraction.ljust(6, '0')) if fraction else 0
+        )
+    except ValueError:
+        return None
+
+
 def validate_json_file(file_path: Union[str, Path]) -> bool:
     """
     Validate if a file contains valid JSON.
@@ -191,13 +406,48 @@ def validate_json_file(file_path: Union[str, Path]) -> bool:
         True if valid JSON, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            json.load(f)
+        # One read plus one parse of the whole buffer; json.loads detects the encoding
+        json.loads(Path(file_path).read_bytes())
         return True
     except (json.JSONDecodeError, FileNotFoundError, PermissionError):
         return False
 
 
+def validate_json_files(file_paths: Iterable[Union[str, Path]]) -> List[bool]:
+    """
+    Validate several JSON files concurrently.
+
+    Args:
+        file_paths: Paths to JSON files
+
+    Returns:
+        List of validation results, in the order of file_paths
+    """
+    return map_concurrent(validate_json_file, file_paths)
+
+
+def map_concurrent(func: Callable[[Any], _T], items: Iterable[Any]) -> List[_T]:
+    """
+    Apply an I/O-bound function to items on a thread pool.
+
+    File reads release the GIL, so this overlaps the open/read latency of
+    many small files. Falls back to a plain loop for zero or one item.
+
+    Args:
+        func: Function to apply to each item
+        items: Items to process
+
+    Returns:
+        List of results, in the order of items
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
 def safe_json_load(file_path: Union[str, Path], default: Any = None) -> Any:
     """
     Safely load JSON file with default fallback.
@@ -210,12 +460,25 @@ def safe_json_load(file_path: Union[str, Path], default: Any = None) -> Any:
         Loaded JSON data or default value
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(Path(file_path).read_bytes())
     except Exception:
         return default
 
 
+def safe_json_load_many(file_paths: Iterable[Union[str, Path]], default: Any = None) -> List[Any]:
+    """
+    Safely load several JSON files concurrently.
+
+    Args:
+        file_paths: Paths to JSON files
+        default: Default value for files that fail to load
+
+    Returns:
+        List of loaded JSON data or default values, in the order of file_paths
+    """
+    return map_concurrent(lambda path: safe_json_load(path, default), file_paths)
+
+
 def ensure_directory(directory: Union[str, Path]) -> bool:
     """
     Ensure directory exists, create if it doesn't.
@@ -250,14 +513,52 @@ def find_files(directory: Union[str, Path], pattern: str, recursive: bool = True
         return []
 
     try:
-        if recursive:
-            return list(directory.rglob(pattern))
-        else:
-            return list(directory.glob(pattern))
+        # Patterns spanning directories need pathlib's full glob support
+        if os.sep in pattern or (os.altsep and os.altsep in pattern) or '**' in pattern:
+            if recursive:
+                return list(directory.rglob(pattern))
+            else:
+                return list(directory.glob(pattern))
+
+        return _scan_files(str(directory), pattern, recursive)
     except Exception:
         return []
 
 
+def _scan_files(directory: str, pattern: str, recursive: bool) -> List[Path]:
+    """
+    Match entry names against a pattern using os.scandir.
+
+    DirEntry caches the file type from the directory listing, so no extra
+    stat call is needed per entry. Symlinked directories are not followed and
+    unreadable subdirectories are skipped, as with Path.rglob.
+
+    Args:
+        directory: Directory to search
+        pattern: File name pattern (glob style, no path separators)
+        recursive: Search recursively
+
+    Returns:
+        List of matching file paths
+    """
+    matches = []
+    pending = [directory]
+
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if fnmatch.fnmatch(entry.name, pattern):
+                        matches.append(Path(entry.path))
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+
+    return matches
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for Windows filesystem.
@@ -268,10 +569,12 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for Windows
     """
-    # Remove or replace invalid characters
-    invalid_chars = r'<>:"/\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Most names are already safe; one regex scan returns them untouched
+    if len(filename) <= 255 and not _UNSAFE_FILENAME_RE.search(filename):
+        return filename
+
+    # Replace invalid characters in a single pass
+    filename = filename.translate(_FILENAME_TRANS)
 
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -284,6 +587,7 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+@lru_cache(maxsize=1)
 def get_app_version() -> str:
     """
     Get application version from package.
@@ -305,6 +609,13 @@ def get_system_info() -> Dict[str, str]:
     Returns:
         Dictionary with system information
     """
+    # The values cannot change while the process runs; hand out a copy of the cache
+    return dict(_get_system_info())
+
+
+@lru_cache(maxsize=1)
+def _get_system_info() -> Dict[str, str]:
+    """Collect system information once per process."""
     import platform
 
     return {
@@ -333,9 +644,12 @@ def is_valid_claude_project_dir(directory: Union[str, Path]) -> bool:
     if not directory.exists() or not directory.is_dir():
         return False
 
-    # Look for .jsonl files which indicate Claude usage data
-    jsonl_files = list(directory.glob("*.jsonl"))
-    return len(jsonl_files) > 0
+    # Look for .jsonl files which indicate Claude usage data; stop at the first one
+    try:
+        with os.scandir(directory) as entries:
+            return any(fnmatch.fnmatch(entry.name, "*.jsonl") for entry in entries)
+    except OSError:
+        return False
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -366,18 +680,12 @@ def escape_html(text: str) -> str:
     Returns:
         HTML-escaped text
     """
-    escape_map = {
-        '&': '&amp;',
-        '<': '&lt;',
-        '>': '&gt;',
-        '"': '&quot;',
-        "'": '&#x27;'
-    }
-
-    for char, escaped in escape_map.items():
-        text = text.replace(char, escaped)
+    # Most text has nothing to escape; return it without building a copy
+    if not _HTML_SPECIAL_RE.search(text):
+        return text
 
-    return text
+    # translate maps each character once, so '&' in the output is never re-escaped
+    return text.translate(_HTML_TRANS)
 
 
 class ProgressTracker:
@@ -395,6 +703,10 @@ class ProgressTracker:
         self.current = 0
         self.callback = callback
 
+        # Report to the callback at most ~1000 times over the whole run
+        self._step = max(1, total // 1000)
+        self._last_report = 0
+
     def update(self, increment: int = 1) -> float:
         """
         Update progress.
@@ -408,7 +720,10 @@ class ProgressTracker:
         self.current = min(self.current + increment, self.total)
         progress = self.current / self.total if self.total > 0 else 1.0
 
-        if self.callback:
+        # Skip callbacks for changes too small to show; always report completion
+        if self.callback and (self.current - self._last_report >= self._step
+                              or self.current >= self.total):
+            self._last_report = self.current
             self.callback(progress, self.current, self.total)
 
         return progress
@@ -416,6 +731,7 @@ class ProgressTracker:
     def reset(self):
         """Reset progress to zero."""
         self.current = 0
+        self._last_report = 0
 
     @property
     def percentage(self) -> float:
@@ -11,12 +11,8 @@ License: MIT
 """
 
 import sys
-import os
-from pathlib import Path
-
-# Add the current directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent))
 
+# Running "python main.py" already puts this directory first on sys.path
 from ccusage_gui import main as gui_main
 
 
@@ -72,10 +72,10 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "ccusage-gui=main:main",
+            "ccusage-gui=ccusage_gui.main:run_app",
         ],
         "gui_scripts": [
-            "ccusage-gui-windowed=main:main",
+            "ccusage-gui-windowed=ccusage_gui.main:run_app",
         ],
     },
     include_package_data=True,